@@ -6,7 +6,11 @@
 # on FastenersCmd.py in FSScrewCommandTable table add an apropriate line.
 
 
+import types
+
 # a table to reuse icons:
+# (both tables are wrapped in MappingProxyType below: they are lookup-only
+# after import and must not be mutated at runtime)
 FSIconAliases = {
     'ASMEB18.2.2.4A' : 'ASMEB18.2.2.1A',
     'DIN1160-A': 'DIN1151-A',
@@ -48,21 +52,18 @@ FSIconAliases = {
     'ISO15072' : 'EN1662',
 }
 
+FSIconAliases = types.MappingProxyType(FSIconAliases)
+
 # a table to reuse similar type standards
-FSTypeAliases = {
+FSTypeAliases = types.MappingProxyType({
     'ISO299' : 'DIN508',
-}
+})
 
 def FSGetIconAlias(name):
-    if name in FSIconAliases:
-        return FSIconAliases[name]
-    return name
+    return FSIconAliases.get(name, name)
 
 def FSGetTypeAlias(type):
-    if type in FSTypeAliases:
-        return FSTypeAliases[type]
-    return type
+    return FSTypeAliases.get(type, type)
 
 def FSAppendAliasesToTable(table):
-    for item in FSTypeAliases.keys():
-        table[item] = table[FSTypeAliases[item]]
+    table.update((alias, table[target]) for alias, target in FSTypeAliases.items())
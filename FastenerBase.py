@@ -32,6 +32,7 @@ import Part
 import os
 import math
 import sys
+import threading
 from pathlib import Path
 import DraftVecUtils
 import re
@@ -49,18 +50,71 @@ matchInnerButtonText = translate("FastenerBase", 'Match for tap hole')
 FsUseGetSetState =  ((FreeCAD.Version()[0]+'.'+FreeCAD.Version()[1]) < '0.22')\
                     or (FreeCAD.Version()[5] == 'LinkDaily')
 
-# function to open a csv file and convert it to a dictionary
-FsData = {}
-FsTitles = {}
-filelist = Path(fsdatapath).glob('*.csv')
-for item in filelist:
-    # FreeCAD.Console.PrintLog("reading " + str(item) + "\n")
-    tables = csv2dict(str(item), item.stem, fieldsnamed=True)
-    for tablename in tables.keys():
-        if tablename == 'titles':
-            FsTitles.update(tables[tablename])
-        else:
-            FsData[tablename] = tables[tablename]
+# The fastener data tables live in the csv files of the FsData folder.
+# Parsing all of them takes a noticeable part of the workbench load time,
+# so reading is deferred until a table is first accessed (when the first
+# fastener is created or restored).
+FsDataLoaded = False
+
+
+def FSLoadDataTables():
+    global FsDataLoaded
+    if FsDataLoaded:
+        return
+    FsDataLoaded = True
+    filelist = Path(fsdatapath).glob('*.csv')
+    for item in filelist:
+        # FreeCAD.Console.PrintLog("reading " + str(item) + "\n")
+        tables = csv2dict(str(item), item.stem, fieldsnamed=True)
+        for tablename in tables.keys():
+            if tablename == 'titles':
+                FsTitles.update(tables[tablename])
+            else:
+                FsData[tablename] = tables[tablename]
+
+
+class FSLazyTableDict(dict):
+    """A dictionary of fastener data tables that triggers reading the
+    csv data files on first access. Every reading accessor loads the
+    tables first, so the laziness can not be bypassed accidentally."""
+
+    def __missing__(self, key):
+        if FsDataLoaded:
+            raise KeyError(key)
+        FSLoadDataTables()
+        return self[key]
+
+    def __contains__(self, key):
+        FSLoadDataTables()
+        return dict.__contains__(self, key)
+
+    def __iter__(self):
+        FSLoadDataTables()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        FSLoadDataTables()
+        return dict.__len__(self)
+
+    def get(self, key, default=None):
+        FSLoadDataTables()
+        return dict.get(self, key, default)
+
+    def keys(self):
+        FSLoadDataTables()
+        return dict.keys(self)
+
+    def values(self):
+        FSLoadDataTables()
+        return dict.values(self)
+
+    def items(self):
+        FSLoadDataTables()
+        return dict.items(self)
+
+
+FsData = FSLazyTableDict()
+FsTitles = FSLazyTableDict()
 
 
 class FSBaseObject:
@@ -176,16 +230,22 @@ def FSAddItemsToType(typeName, item):
 
 # common helpers
 
+def FSQuantityStr(val):
+    """Return a property value that may be a FreeCAD Quantity as a compact
+    number string (trailing zeros and decimal point stripped)"""
+    if isinstance(val, FreeCAD.Units.Quantity):
+        return str(float(val.Value)).rstrip('0').rstrip('.')
+    return val
+
+
 def FSScrewStr(obj):
     """Return the textual representation of the screw diameter x length
     + optional handedness ([M]<dia>x<len>[LH]), also accounting for
     custom size properties"""
-    dia = obj.diameter if obj.diameter != 'Custom' else obj.diameterCustom
-    if isinstance(dia, FreeCAD.Units.Quantity):
-        dia = str(float(dia.Value)).rstrip('0').rstrip('.')
-    length = obj.length if obj.length != 'Custom' else obj.lengthCustom
-    if isinstance(length, FreeCAD.Units.Quantity):
-        length = str(float(length.Value)).rstrip('0').rstrip('.')
+    dia = FSQuantityStr(
+        obj.diameter if obj.diameter != 'Custom' else obj.diameterCustom)
+    length = FSQuantityStr(
+        obj.length if obj.length != 'Custom' else obj.lengthCustom)
     desc = dia + "x" + length
     if obj.leftHanded:
         desc += 'LH'
@@ -228,10 +288,9 @@ FSCache = {}
 
 
 def FSGetKey(*args):
-    key = 'FS'
-    for arg in args:
-        if arg is not None:
-            key = key + '|' + str(arg)
+    # a single join instead of building a new string per argument
+    key = '|'.join(
+        ['FS'] + [str(arg) for arg in args if arg is not None])
     if key in FSCache:
         FreeCAD.Console.PrintLog("Using cached shape for: " + key + "\n")
         return (key, FSCache[key])
@@ -247,15 +306,17 @@ def FSCacheRemoveThreaded():
 
 # extruct the diameter code (metric/imperial) from the given string
 
+DiamStrPattern = re.compile(r"M[\d.]+|#\d+|[\d /]+in|[\d.]+ mm|ST[\d.]+")
+
 
 def cleanDiamStr(m):
     """
     Clean dirty diameter string to be ready for dictionary.
     Example output: 'M3', '#8', '5/8in', '4 mm' and 'ST6.3'
     """
-    res = re.findall(r"M[\d.]+|#\d+|[\d /]+in|[\d.]+ mm|ST[\d.]+", m)
-    # FreeCAD.Console.PrintMessage(m + " -> " + res[0] + "\n")
-    return res[0]
+    res = DiamStrPattern.search(m)
+    # FreeCAD.Console.PrintMessage(m + " -> " + res.group() + "\n")
+    return res.group()
 
 
 def MToFloat(m: str) -> float:
@@ -301,8 +362,19 @@ def FSRemoveDigits(txt):
     return res
 
 
-# get total count of a selected object taking arrays/links into account
-def GetTotalObjectRepeats(obj):
+# get total count of a selected object taking arrays/links into account.
+# when counting many objects of the same document (as the BOM command does),
+# pass a shared dict as repeats_cache so common parents (nested links and
+# arrays) are only walked once
+def GetTotalObjectRepeats(obj, repeats_cache=None):
+    # InList crosses document boundaries through external links and Name is
+    # only unique within one document, so the key needs the document too
+    cache_key = (obj.Document.Name, obj.Name)
+    if repeats_cache is None:
+        repeats_cache = {}
+    elif cache_key in repeats_cache:
+        return repeats_cache[cache_key]
+
     cnt = 1 if obj.Visibility else 0
 
     for parent in obj.InList:
@@ -321,14 +393,15 @@ def GetTotalObjectRepeats(obj):
                     True)  # note: VisibilityList is a tuple
             else:
                 numreps = 1
-        # Draft clones and arrays:
-        elif not hasattr(parent, 'Proxy'):
+        # Draft clones and arrays. A single getattr chain is cheaper than
+        # the hasattr probes (hasattr swallows an exception per miss) and
+        # reads the Proxy property only once:
+        elif (proxyType := getattr(getattr(parent, 'Proxy', None),
+                                   'Type', None)) is None:
             continue
-        elif not hasattr(parent.Proxy, 'Type'):
-            continue
-        elif parent.Proxy.Type == 'Clone':
+        elif proxyType == 'Clone':
             numreps = 1
-        elif parent.Proxy.Type in ('Array', 'PathArray', 'PointArray'):
+        elif proxyType in ('Array', 'PathArray', 'PointArray'):
             # All Link arrays (ortho, polar, circular, path and point) can be
             # expanded to control the visibility of individual elements via its
             # VisibilityList. A Link array that has never been expanded has an
@@ -347,10 +420,11 @@ def GetTotalObjectRepeats(obj):
             # non-Link circular arrays are not handled.
 
         if numreps != 0:
-            parentreps = GetTotalObjectRepeats(parent)
+            parentreps = GetTotalObjectRepeats(parent, repeats_cache)
             # print('Parent:' + parent.Name + '/' + parent.TypeId + ', Reps:' + str(parentreps))
             cnt += numreps * parentreps
 
+    repeats_cache[cache_key] = cnt
     return cnt
 
 
@@ -360,6 +434,8 @@ class FSFaceMaker:
 
     Attributes:
     edges (list): A list of edges defining the shape of the face.
+    pendingPoints (list): Vertices of a run of consecutive line segments
+        that has not been turned into edges yet.
     firstPoint (FreeCAD.Base.Vector or None): The first point of the face.
     lastPoint (FreeCAD.Base.Vector): The last point added to the face.
     """
@@ -374,8 +450,22 @@ class FSFaceMaker:
         and resetting firstPoint.
         """
         self.edges = []
+        self.pendingPoints = []
         self.firstPoint = None
 
+    def _FlushLines(self):
+        """
+        Converts the buffered run of consecutive points into edges.
+        A run of several segments becomes one Part.makePolygon call
+        instead of one Part.makeLine call per segment.
+        """
+        pts = self.pendingPoints
+        if len(pts) > 2:
+            self.edges.extend(Part.makePolygon(pts).Edges)
+        elif len(pts) == 2:
+            self.edges.append(Part.makeLine(pts[0], pts[1]))
+        self.pendingPoints = []
+
     def AddPoint(self, x, z):
         """
         Adds a point (x, z) to the face, creating a line
@@ -384,8 +474,12 @@ class FSFaceMaker:
         curPoint = FreeCAD.Base.Vector(x, 0, z)
         if self.firstPoint is None:
             self.firstPoint = curPoint
+            self.pendingPoints = [curPoint]
         else:
-            self.edges.append(Part.makeLine(self.lastPoint, curPoint))
+            if not self.pendingPoints:
+                # a new run of lines starts at the end of the last curve
+                self.pendingPoints.append(self.lastPoint)
+            self.pendingPoints.append(curPoint)
         self.lastPoint = curPoint
         # FreeCAD.Console.PrintLog("Add Point: " + str(curPoint) + "\n")
 
@@ -398,8 +492,7 @@ class FSFaceMaker:
             return
         else:
             curPoint = self.lastPoint + FreeCAD.Base.Vector(dx, 0, dz)
-            self.edges.append(Part.makeLine(self.lastPoint, curPoint))
-            self.lastPoint = curPoint
+            self.AddPoint(curPoint.x, curPoint.z)
         # FreeCAD.Console.PrintLog("Add Point Rel: " + str(curPoint) + "\n")
 
     def StartPoint(self, x, z):
@@ -411,6 +504,7 @@ class FSFaceMaker:
         """Adds an arc from the last point through (x1, z1) to (x2, z2)."""
         midPoint = FreeCAD.Base.Vector(x1, 0, z1)
         endPoint = FreeCAD.Base.Vector(x2, 0, z2)
+        self._FlushLines()
         self.edges.append(Part.Arc(self.lastPoint, midPoint, endPoint).toShape())
         self.lastPoint = endPoint
 
@@ -437,6 +531,15 @@ class FSFaceMaker:
         z2 = zac + r * math.sin(sa)
         self.AddArc(x1, z1, x2, z2)
 
+    def AddFillet(self, x, z, r):
+        """
+        Adds a 90 degree rounding of radius r starting at (x + r, z) and
+        curving down to (x, z - r); a shorthand for the recurring
+        corner-point + AddArc2 pair.
+        """
+        self.AddPoint(x + r, z)
+        self.AddArc2(0.0, -r, 90)
+
     def AddBSpline(self, *args):
         """
         Adds a B-Spline curve starting at last point through a
@@ -455,6 +558,7 @@ class FSFaceMaker:
         for i in range(0, l, 2):
             pt = FreeCAD.Base.Vector(args[i], 0, args[i + 1])
             pts.append(pt)
+        self._FlushLines()
         self.edges.append(Part.BSplineCurve(pts).toShape())
         self.lastPoint = pt
 
@@ -470,6 +574,7 @@ class FSFaceMaker:
 
     def GetWire(self) -> Part.Wire:
         """Returns a Part.Wire object representing the edges of the face."""
+        self._FlushLines()
         return Part.Wire(self.edges)
 
     def GetClosedWire(self) -> Part.Wire:
@@ -477,7 +582,11 @@ class FSFaceMaker:
         Returns a closed Part.Wire object by adding a line from the last point
         to the first point.
         """
-        self.edges.append(Part.makeLine(self.lastPoint, self.firstPoint))
+        if not self.pendingPoints:
+            self.pendingPoints.append(self.lastPoint)
+        self.pendingPoints.append(self.firstPoint)
+        self.lastPoint = self.firstPoint
+        self._FlushLines()
         w = Part.Wire(self.edges)
         return w
 
@@ -487,6 +596,24 @@ class FSFaceMaker:
         return Part.Face(w)
 
 
+_scratchFaceMakers = threading.local()
+
+
+def FSGetScratchFaceMaker() -> FSFaceMaker:
+    """Returns a reset, thread-local FSFaceMaker ready for a new profile.
+
+    Reusing one instance saves an allocation per generated fastener. The
+    caller must finish its profile (GetFace / GetWire) before anything else
+    on the same thread starts building another one.
+    """
+    fm = getattr(_scratchFaceMakers, 'fm', None)
+    if fm is None:
+        fm = _scratchFaceMakers.fm = FSFaceMaker()
+    else:
+        fm.Reset()
+    return fm
+
+
 def FSAutoDiameterM(holeObj, table, tablepos):
     res = 'M5'
     if holeObj is not None and hasattr(holeObj, 'Curve') and hasattr(holeObj.Curve, 'Radius'):
@@ -724,7 +851,7 @@ class FSFlipCommand:
         for selobj in Gui.Selection.getSelectionEx():
             obj = selobj.Object
             # FreeCAD.Console.PrintLog("sel obj: " + str(obj) + "\n")
-            if hasattr(obj, 'Proxy') and isinstance(obj.Proxy, FSBaseObject):
+            if isinstance(getattr(obj, 'Proxy', None), FSBaseObject):
                 if obj.baseObject is not None:
                     screwObj.append(obj)
         return screwObj
@@ -765,7 +892,7 @@ class FSMoveCommand:
         edgeObj = None
         for selObj in Gui.Selection.getSelectionEx():
             obj = selObj.Object
-            if hasattr(obj, 'Proxy') and isinstance(obj.Proxy, FSBaseObject):
+            if isinstance(getattr(obj, 'Proxy', None), FSBaseObject):
                 screwObj = obj
         aselects = FSGetAttachableSelections()
         if len(aselects) > 0:
@@ -873,6 +1000,32 @@ def InitCheckables():
 class FSMakeBomCommand:
     """Generate fasteners bill of material"""
 
+    # description fragments, translated once on first BOM generation instead
+    # of once per exported object
+    bomStrings = None
+
+    @classmethod
+    def GetBomStrings(cls):
+        if cls.bomStrings is None:
+            cls.bomStrings = {
+                "Screw": translate("FastenerBase", " Screw "),
+                "Nut": translate("FastenerBase", " Nut "),
+                "Washer": translate("FastenerBase", " Washer "),
+                "ThreadedRod": translate("FastenerBase", "Threaded Rod "),
+                "PressNut": translate("FastenerBase", "PEM PressNut "),
+                "Standoff": translate("FastenerBase", "PEM Standoff "),
+                "Stud": translate("FastenerBase", "PEM Stud "),
+                "PcbStandoff": translate("FastenerBase", "PCB Standoff "),
+                "HeatSet": translate("FastenerBase", "Heat Set Insert "),
+                "RetainingRing": translate("FastenerBase", " Retaining Ring "),
+                "TSlotBolt": translate("FastenerBase", " T-Slot Bolt "),
+                "TSlotNut": translate("FastenerBase", " T-Slot Nut "),
+                "HexKey": translate("FastenerBase", " Hex key "),
+                "Nail": translate("FastenerBase", " Nail "),
+                "Pin": translate("Fastenerbase", " Pin "),
+            }
+        return cls.bomStrings
+
     def GetResources(self):
         icon = os.path.join(iconPath, 'IconBOM.svg')
         return {'Pixmap': icon,
@@ -882,101 +1035,111 @@ class FSMakeBomCommand:
 
     def Activated(self):
         self.fastenerDB = {}
+        self.bomStr = self.GetBomStrings()
+        # resolve each Add<name> handler only once per object family
+        methodCache = {}
+        # share one repeat-count cache across the whole document so parent
+        # links/arrays are only walked once
+        repeatsCache = {}
+        for obj in FreeCAD.ActiveDocument.Objects:
+            # Name crosses into the C++ object; read it once per object
+            objName = obj.Name
+            name = FSRemoveDigits(objName)
+            if name in methodCache:
+                method = methodCache[name]
+            else:
+                method = methodCache[name] = getattr(self, 'Add' + name, None)
+            if method is None:
+                # not a fastener, don't bother counting its repeats
+                continue
+            method(obj, GetTotalObjectRepeats(obj, repeatsCache))
+            # FreeCAD.Console.PrintLog('Add ' + str(cnt) + " " + obj.Name  + "\n")
+        if not self.fastenerDB:
+            FreeCAD.Console.PrintMessage(translate(
+                "FastenerBase", "No fasteners in the document") + "\n")
+            return
+        # only create the spreadsheet once we know there is something to list
         sheet = FreeCAD.ActiveDocument.addObject('Spreadsheet::Sheet',
                                                  'Fasteners_BOM')
         sheet.Label = translate("FastenerBase", 'Fasteners_BOM')
         sheet.setColumnWidth('A', 300)
         sheet.set('A1', translate("FastenerBase", "Type"))
         sheet.set('B1', translate("FastenerBase", "Qty"))
-        for obj in FreeCAD.ActiveDocument.Objects:
-            name = FSRemoveDigits(obj.Name)
-            # get total count
-            cnt = GetTotalObjectRepeats(obj)
-            FreeCAD.Console.PrintLog("Using method: Add" + obj.Name + "\n")
-            method = getattr(self, 'Add' + name, lambda x, y: "nothing")
-            method(obj, cnt)
-            # FreeCAD.Console.PrintLog('Add ' + str(cnt) + " " + obj.Name  + "\n")
         line = 2
-        for fastener in sorted(self.fastenerDB.keys()):
-            sheet.set('A' + str(line), fastener)
-            sheet.set('B' + str(line), str(self.fastenerDB[fastener]))
+        for fastener, qty in sorted(self.fastenerDB.items()):
+            # build the row number string once for both cells
+            row = str(line)
+            sheet.set('A' + row, ''.join(fastener))
+            sheet.set('B' + row, str(qty))
             line += 1
         FreeCAD.ActiveDocument.recompute()
         return
 
     def AddFastener(self, fastener, cnt):
-        if fastener in self.fastenerDB:
-            self.fastenerDB[fastener] = self.fastenerDB[fastener] + cnt
-        else:
-            self.fastenerDB[fastener] = cnt
+        # fastener is a tuple of description fragments. Grouping is done on
+        # the tuple and the display string is joined only once per unique
+        # fastener configuration, when the spreadsheet is filled. Interning
+        # the fragments makes the repeated tuple comparisons pointer checks,
+        # since identical fasteners rebuild the same strings per object.
+        fastener = tuple(sys.intern(part) for part in fastener)
+        self.fastenerDB[fastener] = self.fastenerDB.get(fastener, 0) + cnt
 
     def AddScrew(self, obj, cnt):
-        desc = obj.type + translate("FastenerBase",
-                                    " Screw ") + FSScrewStr(obj)
-        self.AddFastener(desc, cnt)
+        self.AddFastener((obj.type, self.bomStr["Screw"], FSScrewStr(obj)), cnt)
 
     def AddNut(self, obj, cnt):
-        if hasattr(obj, 'type'):
-            type = obj.type
-        else:
-            type = 'ISO4033'
-        self.AddFastener(type + translate("FastenerBase",
-                         " Nut ") + obj.diameter, cnt)
+        type = getattr(obj, 'type', 'ISO4033')
+        self.AddFastener((type, self.bomStr["Nut"], obj.diameter), cnt)
 
     def AddWasher(self, obj, cnt):
-        self.AddFastener(obj.type + translate("FastenerBase",
-                         " Washer ") + obj.diameter, cnt)
+        self.AddFastener((obj.type, self.bomStr["Washer"], obj.diameter), cnt)
 
     def AddThreadedRod(self, obj, cnt):
-        desc = translate("FastenerBase", "Threaded Rod ") + FSScrewStr(obj)
-        self.AddFastener(desc, cnt)
+        self.AddFastener((self.bomStr["ThreadedRod"], FSScrewStr(obj)), cnt)
 
     def AddPressNut(self, obj, cnt):
-        self.AddFastener(translate("FastenerBase", "PEM PressNut ") +
-                         obj.diameter + "-" + obj.tcode, cnt)
+        self.AddFastener((self.bomStr["PressNut"],
+                          obj.diameter, "-", obj.tcode), cnt)
 
     def AddStandoff(self, obj, cnt):
-        self.AddFastener(translate("FastenerBase", "PEM Standoff ") +
-                         obj.diameter + "x" + obj.length, cnt)
+        self.AddFastener((self.bomStr["Standoff"],
+                          obj.diameter, "x", obj.length), cnt)
 
     def AddStud(self, obj, cnt):
-        self.AddFastener(translate("FastenerBase", "PEM Stud ") +
-                         obj.diameter + "x" + obj.length, cnt)
+        self.AddFastener((self.bomStr["Stud"],
+                          obj.diameter, "x", obj.length), cnt)
 
     def AddPcbStandoff(self, obj, cnt):
         self.AddFastener(
-            translate("FastenerBase", "PCB Standoff ") +
-            obj.diameter + "x" + obj.width + "x" + obj.length,
+            (self.bomStr["PcbStandoff"],
+             obj.diameter, "x", obj.width, "x", obj.length),
             cnt)
 
     def AddHeatSet(self, obj, cnt):
-        self.AddFastener(
-            translate("FastenerBase", "Heat Set Insert ") + obj.diameter, cnt)
+        self.AddFastener((self.bomStr["HeatSet"], obj.diameter), cnt)
 
     def AddRetainingRing(self, obj, cnt):
-        self.AddFastener(obj.type + translate("FastenerBase",
-                         " Retaining Ring ") + obj.diameter, cnt)
+        self.AddFastener((obj.type, self.bomStr["RetainingRing"],
+                          obj.diameter), cnt)
 
     def AddTSlot(self, obj, cnt):
         if obj.type == "GN505.4":
-            self.AddFastener(obj.type + translate("FastenerBase", " T-Slot Bolt ")
-                             + obj.diameter + " " + obj.slotWidth, cnt)
+            self.AddFastener((obj.type, self.bomStr["TSlotBolt"],
+                              obj.diameter, " ", obj.slotWidth), cnt)
         else:
-            self.AddFastener(obj.type + translate("FastenerBase", " T-Slot Nut ")
-                             + obj.diameter + " " + obj.slotWidth, cnt)
+            self.AddFastener((obj.type, self.bomStr["TSlotNut"],
+                              obj.diameter, " ", obj.slotWidth), cnt)
 
     def AddHexKey(self, obj, cnt):
-        self.AddFastener(obj.type + translate("FastenerBase",
-                         " Hex key ") + obj.diameter + "mm", cnt)
+        self.AddFastener((obj.type, self.bomStr["HexKey"],
+                          obj.diameter, "mm"), cnt)
 
     def AddNail(self, obj, cnt):
-        self.AddFastener(
-            obj.type + translate("FastenerBase", " Nail ") + obj.diameter, cnt
-        )
+        self.AddFastener((obj.type, self.bomStr["Nail"], obj.diameter), cnt)
 
     def AddPin(self, obj, cnt):
         self.AddFastener(
-            obj.type + translate("Fastenerbase", " Pin ") + obj.diameter + "x" + obj.length, cnt
+            (obj.type, self.bomStr["Pin"], obj.diameter, "x", obj.length), cnt
         )
 
     def IsActive(self):
@@ -37,6 +37,9 @@ from FSAliases import FSGetIconAlias, FSGetTypeAlias
 
 screwMaker = ScrewMaker.Instance
 
+# compiled once: matches values that carry a decimal part, e.g. "3.0" / "3."
+DecimalPartPattern = re.compile(r"[.]\d*$")
+
 # These strings are required for fasteners translation in treeview.
 # They are used by the pylupdate5 utility for update *.ts files. Don't delete them.
 translate("FastenerCmdTreeView", "Screw")
@@ -86,9 +89,13 @@ TSlotBoltParameters = { "type", "diameter", "length", "lengthCustom",
 HexKeyParameters = { "type", "diameter", "matchOuter", "keySize" }
 NailParameters = { "type", "diameter", "matchOuter", }
 # this is a list of all possible fastener attribs
+# preview is not an object property: scripts set it directly on the proxy to
+# request draft-quality shapes. It must take part in the cache key so draft
+# and accurate solids are never served for one another.
 FastenerAttribs = ['type', 'diameter', 'thread', 'leftHanded', 'matchOuter', 'length',
                    'lengthCustom', 'width', 'diameterCustom', 'pitchCustom', 'tcode',
-                   'blind', 'screwLength', "slotWidth", 'externalDiam', 'keySize']
+                   'blind', 'screwLength', "slotWidth", 'externalDiam', 'keySize',
+                   'preview']
 
 
 # Names of fasteners groups translated once before FSScrewCommandTable created.
@@ -463,12 +470,12 @@ class FSScrewObject(FSBaseObject):
 
     # get a hash key for the fastener attribs (for cashing similar objects)
     def GetKey(self):
-        key = ""
-        for attr in FastenerAttribs:
-            val = getattr(self, attr)
-            if val is not None:
-                key += attr + ":" + str(val) + "|"
-        return key.rstrip("|")
+        # a single join instead of growing the key one attribute at a time
+        return "|".join(
+            attr + ":" + str(val)
+            for attr in FastenerAttribs
+            if (val := getattr(self, attr)) is not None
+        )
 
     def VerifyMissingAttrs(self, obj, type=None):
         self.updateProps(obj)
@@ -610,7 +617,7 @@ class FSScrewObject(FSBaseObject):
 
     def CleanDecimals(self, val):
         val = str(val)
-        if len(re.findall("[.]\d*$", val)) > 0:
+        if DecimalPartPattern.search(val) is not None:
             return val.rstrip('0').rstrip('.')
         return val
 
@@ -26,6 +26,10 @@
 """
 from screw_maker import *
 
+# revolve profiles keyed by (type, diameter, length) so arrays of
+# identical pins don't rebuild the same face point by point
+profileCache = {}
+
 
 def makeClevisPin(self, fa):
     if fa.type.startswith("ISO2341"):
@@ -33,17 +37,27 @@ def makeClevisPin(self, fa):
     else:
         raise NotImplementedError(f"Unknown fastener type: {fa.type}")
     length = fa.calc_len
-    fm = FSFaceMaker()
-    fm.AddPoint(0.0, k)
-    fm.AddPoint(d_k / 2 - e, k)
-    fm.AddPoint(d_k / 2, k - e)
-    fm.AddPoint(d_k / 2, 0.0)
-    fm.AddPoint(d / 2 + r, 0.0)
-    fm.AddArc2(0.0, -r, 90)
-    fm.AddPoint(d / 2, -length + c)
-    fm.AddPoint(d / 2 - c * math.sqrt(3) / 3, -length)
-    fm.AddPoint(0.0, -length)
-    shape = self.RevolveZ(fm.GetFace())
+    # opt-in draft quality: the rounding arc under the head becomes its
+    # chord, which is far cheaper to revolve and mesh
+    preview = getattr(fa, "preview", False)
+    key = (fa.type, fa.calc_diam, length, preview)
+    face = profileCache.get(key)
+    if face is None:
+        rounding = (d / 2, -r) if preview else (0.0, -r, 90)
+        fm = FSGetScratchFaceMaker()
+        fm.AddPoints(
+            (0.0, k),
+            (d_k / 2 - e, k),
+            (d_k / 2, k - e),
+            (d_k / 2, 0.0),
+            (d / 2 + r, 0.0),
+            rounding,
+            (d / 2, -length + c),
+            (d / 2 - c * tan30, -length),
+            (0.0, -length),
+        )
+        face = profileCache[key] = fm.GetFace()
+    shape = self.RevolveZ(face)
     if fa.type == "ISO2341B":
         # cut out the cross-hole
         drill = Part.makeCylinder(
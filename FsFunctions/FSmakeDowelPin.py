@@ -26,6 +26,10 @@
 """
 from screw_maker import *
 
+# revolve profiles keyed by (type, diameter, length) so arrays of
+# identical pins don't rebuild the same face point by point
+profileCache = {}
+
 
 def makeDowelPin(self, fa):
     if fa.type in ["ISO8734", "ISO2338"]:
@@ -33,13 +37,20 @@ def makeDowelPin(self, fa):
     else:
         raise NotImplementedError(f"Unknown fastener type: {fa.type}")
     length = fa.calc_len
-    fm = FSFaceMaker()
-    cham_d = math.tan(math.radians(15)) * cham
-    fm.AddPoint(0.0, 0.0)
-    fm.AddPoint(dia / 2 - cham_d, 0.0)
-    fm.AddPoint(dia / 2, -cham)
-    fm.AddPoint(dia / 2, cham - length)
-    fm.AddPoint(dia / 2 - cham_d, -length)
-    fm.AddPoint(0.0, -length)
-    shape = self.RevolveZ(fm.GetFace())
+    key = (fa.type, fa.calc_diam, length)
+    face = profileCache.get(key)
+    if face is None:
+        fm = FSGetScratchFaceMaker()
+        r = dia / 2
+        cham_d = tan15 * cham
+        fm.AddPoints(
+            (0.0, 0.0),
+            (r - cham_d, 0.0),
+            (r, -cham),
+            (r, cham - length),
+            (r - cham_d, -length),
+            (0.0, -length),
+        )
+        face = profileCache[key] = fm.GetFace()
+    shape = self.RevolveZ(face)
     return shape
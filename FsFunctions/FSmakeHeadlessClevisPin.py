@@ -26,6 +26,10 @@
 """
 from screw_maker import *
 
+# revolve profiles keyed by (type, diameter, length) so arrays of
+# identical pins don't rebuild the same face point by point
+profileCache = {}
+
 
 def makeHeadlessClevisPin(self, fa):
     if fa.type.startswith("ISO2340"):
@@ -33,14 +37,22 @@ def makeHeadlessClevisPin(self, fa):
     else:
         raise NotImplementedError(f"Unknown fastener type: {fa.type}")
     length = fa.calc_len
-    fm = FSFaceMaker()
-    fm.AddPoint(0.0, 0.0)
-    fm.AddPoint(d_1 / 2 - c * math.tan(math.pi / 6), 0.0)
-    fm.AddPoint(d_1 / 2, -c)
-    fm.AddPoint(d_1 / 2, c - length)
-    fm.AddPoint(d_1 / 2 - c * math.tan(math.pi / 6), -length)
-    fm.AddPoint(0.0, -length)
-    shape = self.RevolveZ(fm.GetFace())
+    key = (fa.type, fa.calc_diam, length)
+    face = profileCache.get(key)
+    if face is None:
+        fm = FSGetScratchFaceMaker()
+        r = d_1 / 2
+        cham_d = c * tan30
+        fm.AddPoints(
+            (0.0, 0.0),
+            (r - cham_d, 0.0),
+            (r, -c),
+            (r, c - length),
+            (r - cham_d, -length),
+            (0.0, -length),
+        )
+        face = profileCache[key] = fm.GetFace()
+    shape = self.RevolveZ(face)
     if fa.type == "ISO2340B":
         # cut the split-pin holes
         drill = Part.makeCylinder(
@@ -49,10 +61,11 @@ def makeHeadlessClevisPin(self, fa):
             Base.Vector(0.0, 0.55 * d_1, -length + l_e),
             Base.Vector(0.0, -1.0, 0.0),
         )
-        shape = shape.cut(drill)
-        shape = shape.cut(
+        # fuse the two holes first so the solid is only cut once
+        drill = drill.fuse(
             drill.mirror(Base.Vector(0.0, 0.0, -length / 2), Base.Vector(0.0, 0.0, 1.0))
         )
+        shape = shape.cut(drill)
         # chamfer the holes
         cham_cutter = Part.makeCone(
             0.6 * d_2,
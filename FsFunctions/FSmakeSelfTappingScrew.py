@@ -25,21 +25,51 @@
 *                                                                         *
 ***************************************************************************
 """
+import functools
 import math
 from FreeCAD import Base
 import FastenerBase
 from screw_maker import FsData
 
+# the tip sharpness is fixed at 45 degrees; precompute its trig values
+cot22_5 = 1.0 / math.tan(math.radians(22.5))
+cos45 = math.cos(math.radians(45.0))
+sin45 = math.sin(math.radians(45.0))
+
+
+@functools.lru_cache(maxsize=None)
+def iso7049Params(SType, diam, dia):
+    """Unpack and derive the per-diameter ISO7049 profile parameters.
+
+    NOTE: The norm ISO1478 defines: "Tapping screws thread"
+    Read data from the thread norm definition
+    instead of duplicating it on the screw definition.
+
+    The data tables are immutable, so the result is cached. dia is the
+    outer diameter as returned by getDia and is part of the key because
+    it may carry the per-instance 3D-print scaling.
+    """
+    P, _, _, d2, _, d3, _, _, rR, _, _, _, _ = FsData["iso1478def"][diam]
+    _, D, _, K, _, r, _, PH, m, h, _ = FsData[SType + "def"][diam]
+
+    ri = d2 / 2.0   # inner thread radius
+    ro = dia / 2.0  # outer thread radius
+
+    # length of cylindrical part where thread begins to grow.
+    slope_length = ro - ri
+
+    return P, d3, rR, D, K, r, PH, m, h, ri, ro, slope_length
+
 def makeSelfTappingScrew(self, fa):
     """
     Make a self tapping screw, used on sheet metal and plastic holes
     Supported types:
     - ISO7049-[C/F/R]: Cross-recessed pan head tapping screws
     """
-    if fa.baseType[:7] == "ISO7049":
-        return makeISO7049(self, fa)
-
-    raise NotImplementedError(f"Unknown fastener type: {fa.baseType}")
+    builder = selfTappingScrewBuilders.get(fa.baseType)
+    if builder is None:
+        raise NotImplementedError(f"Unknown fastener type: {fa.baseType}")
+    return builder(self, fa)
 
 def makeISO7049(self, fa):
     """
@@ -50,73 +80,77 @@ def makeISO7049(self, fa):
     - ISO7049-R: Self tapping screw with round point
     """
     SType = fa.baseType
+    # the point variant, 'C', 'F' or 'R'; compare the single character once
+    # instead of the full designation in every branch below
+    kind = SType[-1]
     l = fa.calc_len
     # Convert from string "ST x.y" to x.y float
     dia = self.getDia(fa.calc_diam, False)
 
-    # NOTE: The norm ISO1478 defines: "Tapping screws thread"
-    # Read data from the thread norm definition
-    # instead of duplicating it on the screw definition.
-    P, _, _, d2, _, d3, _, _, rR, _, _, _, _ = FsData["iso1478def"][fa.calc_diam]
-    _, D, _, K, _, r, _, PH, m, h, _ = fa.dimTable
+    P, d3, rR, D, K, r, PH, m, h, ri, ro, slope_length = iso7049Params(
+        SType, fa.calc_diam, dia)
 
     b = l # length for the thread from the tip
     full_length = True
 
-    ri = d2 / 2.0   # inner thread radius
-    ro = dia / 2.0  # outer thread radius
-
     # inner radius of screw section
     sr = ro
     if fa.thread:
         sr = ri
 
-    # length of cylindrical part where thread begins to grow.
-    slope_length = ro - ri
-
     # Sharpness of screw tip is equal 45 degrees. If imagine half of screw tip
     # as a triangle, then acute-angled angle of the triangle (alpha) be which
     # is equal to half of the screw tip angle.
     alpha = 45
     # And the adjacent cathetus be which is equal to least screw radius (sr)
     # Then the opposite cathetus can be getted by formula: tip_length=sr/tg(alpha)
-    tip_length = sr / math.tan(math.radians(alpha / 2))
-    if SType == "ISO7049-F":
-        tip_length = sr - d3 / 2
+    tip_length = sr * cot22_5
+    if kind == "F":
+        tip_length = sr - d3 * 0.5
+
+    # profile heights reused by several points below; compute them once
+    z_tip = -l + tip_length          # where the tip taper starts
+    z_thread_start = -l + b + slope_length  # entry point of the thread
+
+    # opt-in draft quality: approximate the head and rounding splines with
+    # straight segments, which are far cheaper to revolve and mesh
+    preview = getattr(fa, "preview", False)
 
-    fm = FastenerBase.FSFaceMaker()
+    fm = FastenerBase.FSGetScratchFaceMaker()
 
     # 1) screw head
     fm.AddPoint(0, K)
-    fm.AddBSpline(D/2, K, D/2, 0)
+    if preview:
+        # quadratic midpoint of the head spline, then its end point
+        fm.AddPoints((0.375*D, 0.75*K), (D/2, 0))
+    else:
+        fm.AddBSpline(D/2, K, D/2, 0)
 
     # 2) add rounding under screw head
     rr = r
-    fm.AddPoint(ro+rr, 0)      # first point of rounding
     if fa.thread and full_length:
-        fm.AddBSpline(ro, 0, sr, -slope_length) # create spline rounding
+        fm.AddPoint(ro+rr, 0)      # first point of rounding
+        if preview:
+            fm.AddPoint(sr, -slope_length)  # chord of the spline rounding
+        else:
+            fm.AddBSpline(ro, 0, sr, -slope_length) # create spline rounding
     else:
-        fm.AddArc2(+0, -rr, 90) # in other cases create arc rounding
+        fm.AddFillet(ro, 0, rr) # in other cases create arc rounding
 
     # 3) cylindrical part (place where thread will be added)
     if not full_length:
         if fa.thread:
-            fm.AddPoint(ro, -l+b+slope_length)    # entery point of thread
+            fm.AddPoint(ro, z_thread_start)    # entery point of thread
         fm.AddPoint(sr, -l+b)   # start of full width thread b >= l*0.6
 
-    # 4) tip shape
-    if SType == "ISO7049-C":
-        fm.AddPoint(sr, -l+tip_length)
-        fm.AddPoint(0, -l)
-    if SType == "ISO7049-F":
-        fm.AddPoint(sr, -l+tip_length)
-        fm.AddPoint(d3 / 2, -l)
-        fm.AddPoint(0, -l)
-    if SType == "ISO7049-R":
-        fm.AddPoint(sr, -l+tip_length)
-        fm.AddPoint(rR*math.cos(math.radians(alpha)), rR-l)
-        fm.AddArc2(-rR*math.cos(math.radians(alpha)),
-                   rR*math.sin(math.radians(alpha)), -alpha)
+    # 4) tip shape, added in one bulk call per variant
+    if kind == "C":
+        fm.AddPoints((sr, z_tip), (0, -l))
+    elif kind == "F":
+        fm.AddPoints((sr, z_tip), (d3 * 0.5, -l), (0, -l))
+    elif kind == "R":
+        rx = rR * cos45
+        fm.AddPoints((sr, z_tip), (rx, rR-l), (-rx, rR*sin45, -alpha))
 
     # make screw solid body by revolve a profile
     screw = self.RevolveZ(fm.GetFace())
@@ -128,18 +162,27 @@ def makeISO7049(self, fa):
 
     # make thread
     if fa.thread:
-        if SType == "ISO7049-C":
+        if kind == "C":
             # vanilla usage
-            thread = self.makeDin7998Thread(-l+b+slope_length, -l+tip_length,
+            thread = self.makeDin7998Thread(z_thread_start, z_tip,
                                             -l, ri, ro, P)
-        if SType == "ISO7049-F":
+        elif kind == "F":
             # sent flag to omit the tip thread
-            thread = self.makeDin7998Thread(-l+b+slope_length, -l+tip_length,
+            thread = self.makeDin7998Thread(z_thread_start, z_tip,
                                             -l, ri, ro, P, True)
-        if SType == "ISO7049-R":
+        elif kind == "R":
             # move the tip a little up to compensate roundness
-            thread = self.makeDin7998Thread(-l+b+slope_length, -l+tip_length,
+            thread = self.makeDin7998Thread(z_thread_start, z_tip,
                                             -l+rR, ri, ro, P)
         screw = screw.fuse(thread)
 
     return screw
+
+
+# type designation to builder map, looked up once per screw by
+# makeSelfTappingScrew instead of testing designation prefixes
+selfTappingScrewBuilders = {
+    "ISO7049-C": makeISO7049,
+    "ISO7049-F": makeISO7049,
+    "ISO7049-R": makeISO7049,
+}
@@ -26,6 +26,10 @@
 """
 from screw_maker import *
 
+# revolve profiles keyed by (type, diameter, length) so arrays of
+# identical pins don't rebuild the same face point by point
+profileCache = {}
+
 
 def makeTaperedPin(self, fa):
     if fa.type == "ISO2339":
@@ -33,22 +37,32 @@ def makeTaperedPin(self, fa):
     else:
         raise NotImplementedError(f"Unknown fastener type: {fa.type}")
     length = fa.calc_len
-    d_2 = d_1 + (length -2*a)/ 50
-    r_1 = d_1
-    r_2 = a / 2 + d_1 + (0.02 * length) ** 2 / (8 * a)
-    ang_1 = math.degrees(math.asin(d_1 / 2 / r_1))
-    ang_2 = math.degrees(math.asin(d_2 / 2 / r_2))
-    fm = FSFaceMaker()
-    fm.AddPoint(0.0, 0.0)
-    fm.AddArc(
-        r_2 * math.sin(math.pi / 12), r_2 * (math.cos(math.pi / 12) - 1), d_2 / 2, -a
-    )
-    fm.AddPoint(d_1 / 2, a - length)
-    fm.AddArc(
-        r_1 * math.sin(math.pi / 12),
-        r_1 * (1 - math.cos(math.pi / 12)) - length,
-        0.0,
-        -length,
-    )
-    shape = self.RevolveZ(fm.GetFace())
+    # opt-in draft quality: spherical ends become flat chamfers, which are
+    # far cheaper to revolve and mesh while scrubbing parameters
+    preview = getattr(fa, "preview", False)
+    key = (fa.type, fa.calc_diam, length, preview)
+    face = profileCache.get(key)
+    if face is None:
+        d_2 = d_1 + (length -2*a)/ 50
+        half_d1 = d_1 * 0.5
+        half_d2 = d_2 * 0.5
+        r_1 = d_1
+        r_2 = a / 2 + d_1 + (0.02 * length) ** 2 / (8 * a)
+        ang_1 = math.degrees(math.asin(half_d1 / r_1))
+        ang_2 = math.degrees(math.asin(half_d2 / r_2))
+        if preview:
+            top_end = (half_d2, -a)
+            bottom_end = (0.0, -length)
+        else:
+            top_end = (r_2 * sin15, r_2 * (cos15 - 1), half_d2, -a)
+            bottom_end = (r_1 * sin15, r_1 * (1 - cos15) - length, 0.0, -length)
+        fm = FSGetScratchFaceMaker()
+        fm.AddPoints(
+            (0.0, 0.0),
+            top_end,
+            (half_d1, a - length),
+            bottom_end,
+        )
+        face = profileCache[key] = fm.GetFace()
+    shape = self.RevolveZ(face)
     return shape
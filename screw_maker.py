@@ -88,11 +88,13 @@ __author__ = "Ulrich Brammer <ulrich1a@users.sourceforge.net>"
 import FreeCAD
 import Part
 import math
+import functools
 from FreeCAD import Base
 import importlib
 import FastenerBase
 from FastenerBase import FsData
 from FastenerBase import FSFaceMaker
+from FastenerBase import FSGetScratchFaceMaker
 
 DEBUG = False  # TODO: set to True to show debug messages; does not work.
 
@@ -100,9 +102,26 @@ DEBUG = False  # TODO: set to True to show debug messages; does not work.
 sqrt2 = math.sqrt(2.0)
 sqrt3 = math.sqrt(3.0)
 cos30 = math.cos(math.radians(30.0))
+tan15 = math.tan(math.radians(15.0))
+tan30 = math.tan(math.radians(30.0))
+sin15 = math.sin(math.radians(15.0))
+cos15 = math.cos(math.radians(15.0))
+
+
+@functools.lru_cache(maxsize=None)
+def nominalDiameter(threadstring: str) -> float:
+    """Look up the nominal diameter for a thread designation like "M6",
+    "1/4in", "#6" or "ST 6.3". The diameter tables never change at runtime,
+    so repeated lookups for the same designation are served from the cache.
+    """
+    return FsData["DiaList"][threadstring][0]
 
 
 class Screw:
+    # finished cross-recess solids keyed by (CrossType, m),
+    # see makeHCrossRecess
+    recessCache = {}
+
     def __init__(self):
         self.objAvailable = True
         self.Tuner = 510
@@ -496,7 +515,15 @@ class Screw:
         - CrossType: "0", "1", "2", "3", and "4" are supported.
         - m: Functional outer diameter of the recess.
              This also affects the overall height of the resulting shape.
+
+        The finished solid is cached per parameter pair; callers receive a
+        copy they are free to translate or rotate in place.
         """
+        key = (CrossType, m)
+        cached = cls.recessCache.get(key)
+        if cached is not None:
+            return cached.copy()
+
         b, e_mean, g, f_mean, r, t1, alpha, beta = FsData["iso4757def"][CrossType]
 
         rad265 = math.radians(26.5)
@@ -551,15 +578,20 @@ class Screw:
         isFrenet = False
         corner = Part.Wire(edgeC1).makePipeShell(
             [wire_t_tot], makeSolid, isFrenet)
-        for i in range(4):
-            cross = cross.cut(
-                corner.rotated(
-                    Base.Vector(0, 0, 0),
-                    Base.Vector(0, 0, 1),
-                    90 * i
-                )
+        # fuse the 4 corner cutters so the revolved body is cut in a single
+        # boolean operation instead of four
+        corners = corner.multiFuse([
+            corner.rotated(
+                Base.Vector(0, 0, 0),
+                Base.Vector(0, 0, 1),
+                90 * i
             )
-        return Part.Solid(cross)
+            for i in range(1, 4)
+        ])
+        cross = cross.cut(corners)
+        solid = Part.Solid(cross)
+        cls.recessCache[key] = solid
+        return solid.copy()
 
     @classmethod
     def makeHexRecess(cls, width: float, depth: float, chamfer: bool) -> Part.Shape:
@@ -705,8 +737,7 @@ class Screw:
           self.getDia("M6", True) == 6.65  # 6 * 1.1 + 0.05
         """
         if isinstance(ThreadDiam, str):
-            threadstring = ThreadDiam.strip("()")
-            dia = FsData["DiaList"][threadstring][0]
+            dia = nominalDiameter(ThreadDiam.strip("()"))
         else:
             dia = ThreadDiam
         if self.sm3DPrintMode: